@@ -0,0 +1,51 @@
+"""
+Shared HTTP clients with connection pooling
+"""
+
+from typing import Dict, Optional
+import httpx
+import ollama
+
+_http_client: Optional[httpx.AsyncClient] = None
+_ollama_clients: Dict[str, ollama.AsyncClient] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+        )
+    return _http_client
+
+
+def get_ollama_client(host: str) -> ollama.AsyncClient:
+    """Get the process-wide Ollama client for a host, creating it on first use"""
+    client = _ollama_clients.get(host)
+    if client is None:
+        # Extra keyword arguments are passed on to the underlying httpx client
+        client = ollama.AsyncClient(
+            host=host,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+        )
+        _ollama_clients[host] = client
+    return client
+
+
+async def close_http_client():
+    """Close the shared HTTP clients and their pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+    for client in _ollama_clients.values():
+        # ollama.AsyncClient has no public close; shut down its httpx client
+        await client._client.aclose()
+    _ollama_clients.clear()
@@ -9,10 +9,12 @@ import logging
 import os
 import random
 from typing import List, Dict, Optional
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-import httpx
+from async_lru import alru_cache
 import ollama
+import orjson
+from http_client import get_http_client, get_ollama_client, close_http_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -62,134 +64,405 @@ BEHAVIORAL_QUESTIONS = {
     ],
 }
 
+_CATEGORIES = tuple(BEHAVIORAL_QUESTIONS.keys())
+_FLAT_QUESTIONS = tuple(
+    (category, question)
+    for category, questions in BEHAVIORAL_QUESTIONS.items()
+    for question in questions
+)
+
+
+def _question_schedule():
+    """Yield every question once in shuffled order, reshuffling each pass"""
+    questions = list(_FLAT_QUESTIONS)
+    while True:
+        random.shuffle(questions)
+        yield from questions
+
+
+# Only advanced from the event loop thread, so no locking is needed
+_QUESTION_SCHEDULE = _question_schedule()
+
+# Responses for static data are serialized once at import
+_CATEGORIES_JSON = orjson.dumps({"categories": list(_CATEGORIES)})
+_QUESTIONS_JSON = {
+    category: orjson.dumps({"category": category, "questions": questions})
+    for category, questions in BEHAVIORAL_QUESTIONS.items()
+}
+_PONG_TEXT = orjson.dumps({"type": "pong"}).decode()
+
+# Fixed instructions are sent as the system prompt. They must stay
+# byte-identical across calls so Ollama can reuse the cached prompt prefix.
+EVALUATION_SYSTEM_PROMPT = """You are an expert behavioral interview coach. Evaluate the candidate's interview response using the STAR method.
+
+**Your Task:** Provide constructive feedback in this EXACT JSON format:
+
+{
+  "star_analysis": {
+    "situation": { "present": true/false, "feedback": "brief feedback" },
+    "task": { "present": true/false, "feedback": "brief feedback" },
+    "action": { "present": true/false, "feedback": "brief feedback" },
+    "result": { "present": true/false, "feedback": "brief feedback" }
+  },
+  "score": 1-10,
+  "strengths": ["strength1", "strength2"],
+  "improvements": ["improvement1", "improvement2"],
+  "improved_answer_snippet": "A brief example of how to improve one part of their answer"
+}
+
+Be encouraging but honest. Focus on actionable improvements. Respond with ONLY valid JSON."""
+
+EVALUATION_PROMPT = "**Question Asked:** {question}\n\n**Candidate's Answer:** {answer}"
+
+FOLLOWUP_SYSTEM_PROMPT = """You are conducting a behavioral interview. Based on the exchange between you and the candidate, generate ONE brief follow-up question.
+
+Generate a natural follow-up question that:
+1. Digs deeper into a specific part of their answer
+2. Asks for more details or clarification
+3. Is concise (under 20 words)
+
+Respond with ONLY the follow-up question, nothing else."""
+
+FOLLOWUP_PROMPT = "Original Question: {question}\nCandidate's Answer: {answer}"
+
+# Parts of the fallback evaluation that don't depend on the answer.
+# Shared between responses, so never mutate them.
+_FALLBACK_ACTION = {
+    "present": True,
+    "feedback": "Good - you described actions taken.",
+}
+_FALLBACK_EVALUATION = {
+    "strengths": [
+        "You provided a response",
+        "Shows engagement with the question",
+    ],
+    "improvements": [
+        "Add more specific details",
+        "Include quantifiable results",
+    ],
+    "improved_answer_snippet": "Consider starting with: 'In my role as [position], I faced [specific situation]...'",
+}
+
+# Streamed evaluation progress is flushed every N chunks or T seconds
+PROGRESS_FLUSH_CHUNKS = 32
+PROGRESS_FLUSH_INTERVAL = 0.05
+# Pending snapshots beyond this are dropped, oldest first
+PROGRESS_QUEUE_SIZE = 64
+
+# Largest submit_answers_batch accepted per message
+MAX_BATCH_ANSWERS = int(os.getenv("MAX_BATCH_ANSWERS", "10"))
+# Evaluations a single socket runs at once; matches Ollama's parallel slots
+BATCH_CONCURRENCY = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+
+async def send_message(
+    websocket: WebSocket, message: Dict, index: Optional[int] = None
+):
+    """Send a JSON message, tagged with its batch index if any
+
+    Serialized with orjson but sent as a text frame, since the frontend
+    parses ``event.data`` as a string.
+    """
+    if index is not None:
+        message["index"] = index
+    await websocket.send_text(orjson.dumps(message).decode())
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> Optional[Dict]:
+    """Decode the JSON object embedded in surrounding text
+
+    Decoding starts at the first ``{`` and stops where that object ends, so
+    trailing text (even with braces) is ignored and the text is read once.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        data, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _count_words(text: str) -> int:
+    """Approximate the word count with C-level scans instead of a split
+
+    Spaces and newlines both separate words, so multi-line answers count
+    correctly; runs of separators slightly overcount.
+    """
+    text = text.strip()
+    if not text:
+        return 0
+    return text.count(" ") + text.count("\n") + 1
+
+
+class _JsonObjectEnd:
+    """Detect where a streamed JSON object closes
+
+    Braces inside string values (including escaped quotes) are ignored, so a
+    reply like ``{"tip": "use } carefully"}`` is not cut short.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "started")
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+
+    def feed(self, text: str) -> bool:
+        """Scan the next chunk; True once the outermost object has closed"""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+def _put_latest(queue: asyncio.Queue, item):
+    """Put an item on a bounded queue, dropping the oldest one if full"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
 
 class InterviewService:
     def __init__(self):
         self.environment = os.getenv("ENVIRONMENT", "development")
         self.ollama_url = os.getenv("OLLAMA_URL", "http://host.docker.internal:11434")
         self.model_name = "qwen2.5:3b-instruct-q4_K_M"
+        # Keep the model (and its cached system prompt prefix) loaded between calls
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
         self.client: Optional[ollama.AsyncClient] = None
+        # Remembers a successful Ollama check across restarts
+        self.ready_file = os.getenv("OLLAMA_READY_FILE", "/tmp/interview_ollama_ready")
+        self._check_task: Optional[asyncio.Task] = None
         logger.info(
             f"Interview Service: {self.environment} mode, Ollama: {self.ollama_url}"
         )
 
     async def initialize(self):
-        """Initialize Ollama connection"""
+        """Initialize Ollama connection
+
+        If a previous start already verified Ollama, the client is used right
+        away and the check runs in the background instead of blocking startup.
+        """
+        if self._was_ready():
+            logger.info("Ollama was ready on last start, checking in background")
+            self.client = get_ollama_client(self.ollama_url)
+            self._check_task = asyncio.create_task(self._check_ollama())
+            return True
+        return await self._check_ollama()
+
+    async def _check_ollama(self) -> bool:
+        """Probe Ollama and set up the client, clearing it on failure"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                if response.status_code != 200:
-                    raise Exception(f"Ollama not available: {response.status_code}")
+            client = get_http_client()
+            response = await client.get(f"{self.ollama_url}/api/tags")
+            if response.status_code != 200:
+                raise Exception(f"Ollama not available: {response.status_code}")
 
-            self.client = ollama.AsyncClient(host=self.ollama_url)
+            self.client = get_ollama_client(self.ollama_url)
+            self._mark_ready(True)
             logger.info("Ollama client initialized successfully")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize Ollama: {e}")
+            self.client = None
+            self._mark_ready(False)
             return False
 
+    async def close(self):
+        """Stop the background Ollama check before the clients are closed"""
+        task, self._check_task = self._check_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _was_ready(self) -> bool:
+        """Check whether a previous start already verified this model"""
+        try:
+            with open(self.ready_file) as f:
+                return f.read() == self.model_name
+        except OSError:
+            return False
+
+    def _mark_ready(self, ready: bool):
+        """Record (or forget) that Ollama and the model were available"""
+        try:
+            if ready:
+                with open(self.ready_file, "w") as f:
+                    f.write(self.model_name)
+            elif os.path.exists(self.ready_file):
+                os.remove(self.ready_file)
+        except OSError as e:
+            logger.warning(f"Could not update {self.ready_file}: {e}")
+
     def get_random_question(self, category: Optional[str] = None) -> Dict[str, str]:
         """Get a random behavioral question"""
         if category and category in BEHAVIORAL_QUESTIONS:
-            questions = BEHAVIORAL_QUESTIONS[category]
+            question = random.choice(BEHAVIORAL_QUESTIONS[category])
         else:
-            category = random.choice(list(BEHAVIORAL_QUESTIONS.keys()))
-            questions = BEHAVIORAL_QUESTIONS[category]
+            category, question = next(_QUESTION_SCHEDULE)
 
-        return {"category": category, "question": random.choice(questions)}
+        return {"category": category, "question": question}
 
     def get_all_categories(self) -> List[str]:
         """Get all available question categories"""
-        return list(BEHAVIORAL_QUESTIONS.keys())
+        return list(_CATEGORIES)
 
     async def evaluate_answer_stream(
-        self, question: str, answer: str, websocket: WebSocket
+        self,
+        question: str,
+        answer: str,
+        websocket: WebSocket,
+        index: Optional[int] = None,
     ):
-        """Stream evaluation of interview answer using STAR method"""
+        """Stream evaluation of interview answer using STAR method
+
+        When ``index`` is given (batched submissions), every message sent for
+        this answer carries it so the client can route concurrent streams.
+        """
         if not self.client:
-            await websocket.send_json(
-                {"type": "error", "message": "AI service not available"}
+            await send_message(
+                websocket,
+                {"type": "error", "message": "AI service not available"},
+                index,
             )
             return
 
-        prompt = f"""You are an expert behavioral interview coach. Evaluate this interview response using the STAR method.
-
-**Question Asked:** {question}
-
-**Candidate's Answer:** {answer}
-
-**Your Task:** Provide constructive feedback in this EXACT JSON format:
-
-{{
-  "star_analysis": {{
-    "situation": {{ "present": true/false, "feedback": "brief feedback" }},
-    "task": {{ "present": true/false, "feedback": "brief feedback" }},
-    "action": {{ "present": true/false, "feedback": "brief feedback" }},
-    "result": {{ "present": true/false, "feedback": "brief feedback" }}
-  }},
-  "score": 1-10,
-  "strengths": ["strength1", "strength2"],
-  "improvements": ["improvement1", "improvement2"],
-  "improved_answer_snippet": "A brief example of how to improve one part of their answer"
-}}
-
-Be encouraging but honest. Focus on actionable improvements. Respond with ONLY valid JSON."""
+        prompt = EVALUATION_PROMPT.format(question=question, answer=answer)
 
         try:
-            # Stream the response for faster perceived performance
-            full_response = ""
-            async for chunk in await self.client.generate(
-                model=self.model_name,
-                prompt=prompt,
-                options={
-                    "temperature": 0.7,
-                    "num_predict": 800,
-                },
-                stream=True,
-            ):
-                if "response" in chunk:
-                    full_response += chunk["response"]
-                    # Send progress updates
-                    await websocket.send_json(
-                        {
-                            "type": "evaluation_progress",
-                            "partial": (
-                                full_response[-50:]
-                                if len(full_response) > 50
-                                else full_response
-                            ),
-                        }
-                    )
+            # Stream the response for faster perceived performance. Generation
+            # and websocket writes run concurrently, joined by a bounded queue,
+            # so a slow client never stalls reading tokens from Ollama.
+            progress: asyncio.Queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_SIZE)
+            producer = asyncio.create_task(self._generate_evaluation(prompt, progress))
+            try:
+                await self._forward_progress(progress, websocket, index)
+                full_response = await producer
+            finally:
+                producer.cancel()
 
             # Parse the complete response
             try:
-                # Find JSON in response
-                start = full_response.find("{")
-                end = full_response.rfind("}") + 1
-                if start >= 0 and end > start:
-                    json_str = full_response[start:end]
-                    evaluation = json.loads(json_str)
-                    await websocket.send_json(
-                        {"type": "evaluation_complete", "data": evaluation}
-                    )
-                else:
-                    raise ValueError("No JSON found")
-            except (json.JSONDecodeError, ValueError):
+                try:
+                    evaluation = orjson.loads(full_response)
+                except orjson.JSONDecodeError:
+                    # Slow path: find JSON embedded in surrounding text
+                    evaluation = _extract_json_object(full_response)
+                    if evaluation is None:
+                        raise ValueError("No JSON found")
+                await send_message(
+                    websocket,
+                    {"type": "evaluation_complete", "data": evaluation},
+                    index,
+                )
+            except (orjson.JSONDecodeError, ValueError):
                 # Fallback evaluation
-                await websocket.send_json(
+                await send_message(
+                    websocket,
                     {
                         "type": "evaluation_complete",
                         "data": self._fallback_evaluation(answer),
-                    }
+                    },
+                    index,
                 )
 
         except Exception as e:
             logger.error(f"Evaluation error: {e}")
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await send_message(websocket, {"type": "error", "message": str(e)}, index)
+
+    async def _generate_evaluation(self, prompt: str, progress: asyncio.Queue) -> str:
+        """Stream the evaluation from Ollama, queueing progress snapshots
+
+        Snapshots (the tail of the response so far) are queued every N chunks
+        or T seconds. ``None`` is queued once generation stops, which is as
+        soon as the outermost JSON object is balanced.
+        """
+        full_response = ""
+        pending_chunks = 0
+        object_end = _JsonObjectEnd()
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+        stream = None
+        try:
+            stream = await self.client.generate(
+                model=self.model_name,
+                system=EVALUATION_SYSTEM_PROMPT,
+                prompt=prompt,
+                keep_alive=self.keep_alive,
+                options={
+                    "temperature": 0.7,
+                    "num_predict": 800,
+                },
+                format="json",  # Request raw JSON so it parses directly
+                stream=True,
+            )
+            async for chunk in stream:
+                if "response" in chunk:
+                    text = chunk["response"]
+                    full_response += text
+                    pending_chunks += 1
+                    if (
+                        pending_chunks >= PROGRESS_FLUSH_CHUNKS
+                        or loop.time() - last_flush > PROGRESS_FLUSH_INTERVAL
+                    ):
+                        _put_latest(progress, full_response[-50:])
+                        pending_chunks = 0
+                        last_flush = loop.time()
+
+                    # Stop once the outermost JSON object closes instead of
+                    # letting the model run on to num_predict
+                    if object_end.feed(text):
+                        break
+
+            if pending_chunks:
+                _put_latest(progress, full_response[-50:])
+        finally:
+            if stream is not None:
+                # Closing the stream ends the request, so Ollama stops generating
+                await stream.aclose()
+            _put_latest(progress, None)
+
+        return full_response
+
+    async def _forward_progress(
+        self, progress: asyncio.Queue, websocket: WebSocket, index: Optional[int]
+    ):
+        """Send queued progress snapshots until generation stops"""
+        while True:
+            partial = await progress.get()
+            if partial is None:
+                return
+            await send_message(
+                websocket, {"type": "evaluation_progress", "partial": partial}, index
+            )
 
     def _fallback_evaluation(self, answer: str) -> Dict:
         """Provide basic feedback when AI is unavailable"""
-        word_count = len(answer.split())
+        word_count = _count_words(answer)
         has_details = word_count > 50
 
         return {
@@ -202,68 +475,55 @@ Be encouraging but honest. Focus on actionable improvements. Respond with ONLY v
                     "present": has_details,
                     "feedback": "Clarify your specific responsibility.",
                 },
-                "action": {
-                    "present": True,
-                    "feedback": "Good - you described actions taken.",
-                },
+                "action": _FALLBACK_ACTION,
                 "result": {
                     "present": word_count > 100,
                     "feedback": "Include measurable outcomes if possible.",
                 },
             },
             "score": 5 + min(word_count // 30, 3),
-            "strengths": [
-                "You provided a response",
-                "Shows engagement with the question",
-            ],
-            "improvements": [
-                "Add more specific details",
-                "Include quantifiable results",
-            ],
-            "improved_answer_snippet": "Consider starting with: 'In my role as [position], I faced [specific situation]...'",
+            **_FALLBACK_EVALUATION,
         }
 
+    @alru_cache(maxsize=512)
+    async def _generate_followup(self, question: str, answer: str) -> str:
+        """Ask the model for a follow-up question, cached per exchange"""
+        prompt = FOLLOWUP_PROMPT.format(question=question, answer=answer)
+
+        response = await self.client.generate(
+            model=self.model_name,
+            system=FOLLOWUP_SYSTEM_PROMPT,
+            prompt=prompt,
+            keep_alive=self.keep_alive,
+            options={"temperature": 0.8, "num_predict": 50},
+        )
+        return response["response"].strip().strip('"')
+
     async def generate_followup_stream(
         self, question: str, answer: str, websocket: WebSocket
     ):
         """Generate a follow-up question based on the answer"""
         if not self.client:
-            await websocket.send_json(
+            await send_message(
+                websocket,
                 {
                     "type": "followup",
                     "question": "Can you tell me more about the specific results you achieved?",
-                }
+                },
             )
             return
 
-        prompt = f"""You are conducting a behavioral interview. Based on this exchange, generate ONE brief follow-up question.
-
-Original Question: {question}
-Candidate's Answer: {answer}
-
-Generate a natural follow-up question that:
-1. Digs deeper into a specific part of their answer
-2. Asks for more details or clarification
-3. Is concise (under 20 words)
-
-Respond with ONLY the follow-up question, nothing else."""
-
         try:
-            response = await self.client.generate(
-                model=self.model_name,
-                prompt=prompt,
-                options={"temperature": 0.8, "num_predict": 50},
-            )
-
-            followup = response["response"].strip().strip('"')
-            await websocket.send_json({"type": "followup", "question": followup})
+            followup = await self._generate_followup(question, answer)
+            await send_message(websocket, {"type": "followup", "question": followup})
         except Exception as e:
             logger.error(f"Follow-up generation error: {e}")
-            await websocket.send_json(
+            await send_message(
+                websocket,
                 {
                     "type": "followup",
                     "question": "Can you elaborate on the specific impact of your actions?",
-                }
+                },
             )
 
 
@@ -276,6 +536,12 @@ async def startup():
     await interview_service.initialize()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await interview_service.close()
+    await close_http_client()
+
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "service": "interview"}
@@ -284,7 +550,7 @@ async def health():
 @app.get("/categories")
 async def get_categories():
     """Get all question categories"""
-    return {"categories": interview_service.get_all_categories()}
+    return Response(content=_CATEGORIES_JSON, media_type="application/json")
 
 
 @app.get("/question")
@@ -296,9 +562,9 @@ async def get_question(category: Optional[str] = None):
 @app.get("/questions/{category}")
 async def get_category_questions(category: str):
     """Get all questions for a category"""
-    if category not in BEHAVIORAL_QUESTIONS:
+    if category not in _QUESTIONS_JSON:
         raise HTTPException(status_code=404, detail="Category not found")
-    return {"category": category, "questions": BEHAVIORAL_QUESTIONS[category]}
+    return Response(content=_QUESTIONS_JSON[category], media_type="application/json")
 
 
 @app.websocket("/ws/interview")
@@ -319,12 +585,13 @@ async def interview_websocket(websocket: WebSocket):
                 category = data.get("category")
                 q = interview_service.get_random_question(category)
                 current_question = q["question"]
-                await websocket.send_json(
+                await send_message(
+                    websocket,
                     {
                         "type": "question",
                         "category": q["category"],
                         "question": current_question,
-                    }
+                    },
                 )
 
             elif message_type == "submit_answer":
@@ -333,20 +600,23 @@ async def interview_websocket(websocket: WebSocket):
                 question = data.get("question") or current_question
 
                 if not answer.strip():
-                    await websocket.send_json(
-                        {"type": "error", "message": "Please provide an answer"}
+                    await send_message(
+                        websocket,
+                        {"type": "error", "message": "Please provide an answer"},
                     )
                     continue
 
                 if not question:
-                    await websocket.send_json(
-                        {"type": "error", "message": "No question context available"}
+                    await send_message(
+                        websocket,
+                        {"type": "error", "message": "No question context available"},
                     )
                     continue
 
                 # Send acknowledgment
-                await websocket.send_json(
-                    {"type": "evaluating", "message": "Analyzing your response..."}
+                await send_message(
+                    websocket,
+                    {"type": "evaluating", "message": "Analyzing your response..."},
                 )
 
                 # Stream evaluation
@@ -354,6 +624,78 @@ async def interview_websocket(websocket: WebSocket):
                     question, answer, websocket
                 )
 
+            elif message_type == "submit_answers_batch":
+                # Evaluate several answers concurrently; Ollama runs up to
+                # OLLAMA_NUM_PARALLEL of them at once
+                items = data.get("answers") or []
+                if not isinstance(items, list) or not all(
+                    isinstance(item, dict)
+                    and isinstance(item.get("answer", ""), str)
+                    and isinstance(item.get("question") or "", str)
+                    for item in items
+                ):
+                    await send_message(
+                        websocket,
+                        {
+                            "type": "error",
+                            "message": "answers must be a list of {question, answer} objects",
+                        },
+                    )
+                    continue
+
+                if len(items) > MAX_BATCH_ANSWERS:
+                    await send_message(
+                        websocket,
+                        {
+                            "type": "error",
+                            "message": f"At most {MAX_BATCH_ANSWERS} answers per batch",
+                        },
+                    )
+                    continue
+
+                pairs = [
+                    (item.get("question") or current_question, item.get("answer", ""))
+                    for item in items
+                ]
+
+                if not pairs or any(not a.strip() for _, a in pairs):
+                    await send_message(
+                        websocket,
+                        {"type": "error", "message": "Please provide an answer"},
+                    )
+                    continue
+
+                if any(not q for q, _ in pairs):
+                    await send_message(
+                        websocket,
+                        {"type": "error", "message": "No question context available"},
+                    )
+                    continue
+
+                await send_message(
+                    websocket,
+                    {
+                        "type": "evaluating",
+                        "message": "Analyzing your responses...",
+                        "count": len(pairs),
+                    },
+                )
+
+                slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+                async def evaluate(i, question, answer):
+                    async with slots:
+                        await interview_service.evaluate_answer_stream(
+                            question, answer, websocket, index=i
+                        )
+
+                await asyncio.gather(
+                    *(
+                        evaluate(i, question, answer)
+                        for i, (question, answer) in enumerate(pairs)
+                    )
+                )
+
             elif message_type == "get_followup":
                 # Generate follow-up question
                 answer = data.get("answer", "")
@@ -365,7 +707,7 @@ async def interview_websocket(websocket: WebSocket):
                     )
 
             elif message_type == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(_PONG_TEXT)
 
     except WebSocketDisconnect:
         logger.info("Interview WebSocket disconnected")
@@ -380,4 +722,12 @@ async def interview_websocket(websocket: WebSocket):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+    )
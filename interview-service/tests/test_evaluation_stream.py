@@ -0,0 +1,70 @@
+import asyncio
+
+import orjson
+
+import main
+from main import InterviewService, _JsonObjectEnd
+
+
+class FakeClient:
+    """Streams a canned reply in fixed-size chunks, recording how far it got"""
+
+    def __init__(self, reply: str, chunk_size: int = 3):
+        self.chunks = [reply[i:i + chunk_size] for i in range(0, len(reply), chunk_size)]
+        self.sent = 0
+        self.closed = False
+
+    async def generate(self, **kwargs):
+        async def stream():
+            try:
+                for chunk in self.chunks:
+                    self.sent += 1
+                    yield {"response": chunk}
+            finally:
+                self.closed = True
+
+        return stream()
+
+
+def generate(reply: str, chunk_size: int = 3):
+    service = InterviewService()
+    service.client = FakeClient(reply, chunk_size)
+    progress = asyncio.Queue(maxsize=main.PROGRESS_QUEUE_SIZE)
+    result = asyncio.run(service._generate_evaluation("prompt", progress))
+    return result, service.client
+
+
+def feed_all(text: str, chunk_size: int) -> int:
+    """Return how many characters were consumed before the object closed"""
+    detector = _JsonObjectEnd()
+    for start in range(0, len(text), chunk_size):
+        if detector.feed(text[start:start + chunk_size]):
+            return start + chunk_size
+    return -1
+
+
+def test_brace_inside_string_does_not_end_object():
+    reply = '{"score": 8, "improved_answer_snippet": "use } carefully", "tips": ["a{b"]}'
+    full, client = generate(reply)
+
+    assert orjson.loads(full) == orjson.loads(reply)
+    assert client.sent == len(client.chunks)
+
+
+def test_escaped_quote_keeps_string_open():
+    reply = '{"feedback": "say \\"}\\" aloud", "score": 7}'
+    assert feed_all(reply, 1) == len(reply)
+
+
+def test_escaped_backslash_closes_string():
+    reply = '{"path": "C:\\\\", "score": 5}'
+    assert feed_all(reply, 1) == len(reply)
+
+
+def test_stream_stops_after_object_closes():
+    reply = '{"score": 9, "nested": {"a": 1}}' + " trailing" * 50
+    full, client = generate(reply, chunk_size=1)
+
+    assert full == '{"score": 9, "nested": {"a": 1}}'
+    assert client.sent < len(client.chunks)
+    assert client.closed
@@ -2,15 +2,130 @@
 AI-powered resume advice service using Ollama LLM
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import Dict, List, Optional
-import httpx
-import ollama
+from typing import Dict, List, Optional, Tuple
+from async_lru import alru_cache
+import orjson
+from http_client import get_http_client, get_ollama_client
 
 logger = logging.getLogger(__name__)
 
+# Fixed instructions are sent as the system prompt. They must stay
+# byte-identical across calls so Ollama can reuse the cached prompt prefix.
+ADVICE_SYSTEM_PROMPT = """You are an expert ATS (Applicant Tracking System) resume consultant helping candidates optimize their resumes for specific job postings.
+
+**Your Task:**
+Using the resume analysis provided, give actionable, specific resume advice in JSON format. Focus on concrete improvements that will increase the ATS match score.
+
+**Requirements:**
+1. Respond with ONLY valid JSON (no additional text before or after)
+2. Use this exact structure:
+
+{
+  "skills_to_add": ["skill1", "skill2", "skill3"],
+  "skills_to_emphasize": ["existing_skill1", "existing_skill2"],
+  "resume_structure": ["tip1", "tip2", "tip3"],
+  "content_optimization": ["tip1", "tip2", "tip3"],
+  "keyword_strategy": "One clear paragraph explaining how to naturally integrate missing keywords",
+  "overall_priority": ["top_priority1", "top_priority2", "top_priority3"]
+}
+
+**Guidelines:**
+- skills_to_add: Select 3-5 most critical missing keywords/skills from the job description
+- skills_to_emphasize: Identify 2-4 existing skills that match the job and should be highlighted more prominently
+- resume_structure: Provide 2-4 specific formatting/organization tips for ATS optimization
+- content_optimization: Give 2-4 specific tips for improving bullet points and descriptions
+- keyword_strategy: Write one clear, actionable paragraph (2-3 sentences) explaining how to naturally incorporate missing keywords
+- overall_priority: List 2-4 most important actions to take immediately, ordered by impact
+
+Respond with valid JSON only."""
+
+ADVICE_PROMPT = """**Resume Analysis:**
+- Match Score: {similarity_score:.1%}
+- Missing Keywords: {missing_keywords}
+- Shared Keywords: {shared_keywords}"""
+
+INTERVIEW_FEEDBACK_SYSTEM_PROMPT = """You are a Senior Technical Recruiter. Evaluate the spoken interview answer
+using the STAR method (Situation, Task, Action, Result).
+
+**Requirements:**
+1. Respond in valid JSON only.
+2. Identify which STAR components are missing.
+3. Give a 'STAR Score' out of 10.
+4. Provide one specific "Pro Tip" for improvement.
+
+Format:
+{
+"star_score": 8,
+"missing_components": ["Result"],
+"feedback": "Your action was clear, but you didn't quantify the outcome.",
+"pro_tip": "Try saying 'This resulted in a 20% increase in...' next time."
+}"""
+
+INTERVIEW_FEEDBACK_PROMPT = '**User Answer:** "{transcription}"'
+
+_REQUIRED_ADVICE_FIELDS = frozenset(
+    {
+        "skills_to_add",
+        "skills_to_emphasize",
+        "resume_structure",
+        "content_optimization",
+        "keyword_strategy",
+        "overall_priority",
+    }
+)
+
+# Parts of the fallback advice that don't depend on the analysis.
+# Shared between responses, so never mutate them.
+_FALLBACK_ADVICE = {
+    "resume_structure": [
+        "Use clear section headers: Summary, Experience, Skills, Education",
+        "Use bullet points with strong action verbs (developed, implemented, led)",
+        "Keep formatting simple and ATS-friendly (avoid tables, text boxes, headers/footers)",
+        "Include a dedicated 'Technical Skills' or 'Core Competencies' section",
+    ],
+    "content_optimization": [
+        "Quantify achievements with specific metrics and results (e.g., 'Increased efficiency by 30%')",
+        "Tailor experience descriptions to match job requirements and use similar language",
+        "Use industry-standard terminology and avoid uncommon abbreviations",
+        "Start each bullet point with a strong action verb in past tense",
+    ],
+    "keyword_strategy": "Naturally integrate the missing keywords throughout your resume, especially in your skills section and experience descriptions. Focus on incorporating them in context rather than simply listing them. Use variations of the keywords where appropriate to demonstrate comprehensive understanding.",
+    "overall_priority": [
+        "Add the top 3-5 missing technical skills to your resume if you have them",
+        "Quantify your achievements with specific numbers, percentages, or outcomes",
+        "Tailor your professional summary to highlight experience relevant to this role",
+        "Ensure your skills section prominently features keywords from the job description",
+    ],
+}
+
+# Largest advice batch accepted per request
+MAX_BATCH_ADVICE = int(os.getenv("MAX_BATCH_ADVICE", "10"))
+# Generations a single batch runs at once; matches Ollama's parallel slots
+BATCH_CONCURRENCY = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> Optional[Dict]:
+    """Decode the JSON object embedded in surrounding text
+
+    Decoding starts at the first ``{`` and stops where that object ends, so
+    trailing text (even with braces) is ignored and the text is read once.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        data, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
 
 class AdviceService:
     def __init__(self):
@@ -31,34 +146,85 @@ class AdviceService:
             )
             self.model_name = "qwen2.5:3b-instruct-q4_K_M"  # Qwen2.5 model locally
 
+        # Keep the model (and its cached system prompt prefix) loaded between calls
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
         self.client = None
+        # Remembers a successful model check across restarts
+        self.ready_file = os.getenv("OLLAMA_READY_FILE", "/tmp/advice_ollama_ready")
+        self._check_task: Optional[asyncio.Task] = None
         logger.info(f"Initializing AdviceService for {self.environment} environment")
         logger.info(f"Ollama URL: {self.ollama_url}, Model: {self.model_name}")
 
     async def initialize_model(self):
-        """Initialize Ollama client and ensure model is available"""
+        """Initialize Ollama client and ensure model is available
+
+        If a previous start already verified the model, the client is used
+        right away and the check runs in the background instead of blocking
+        startup.
+        """
+        if self._was_ready():
+            logger.info(f"Model {self.model_name} was ready on last start")
+            self.client = get_ollama_client(self.ollama_url)
+            self._check_task = asyncio.create_task(self._check_model())
+        else:
+            await self._check_model()
+
+    async def _check_model(self):
+        """Probe Ollama and pull the model if needed, clearing the client on failure"""
         try:
             # Check if Ollama is available
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                if response.status_code != 200:
-                    raise Exception(f"Ollama not available: {response.status_code}")
+            client = get_http_client()
+            response = await client.get(f"{self.ollama_url}/api/tags")
+            if response.status_code != 200:
+                raise Exception(f"Ollama not available: {response.status_code}")
 
             # Initialize Ollama client
-            self.client = ollama.AsyncClient(host=self.ollama_url)
+            self.client = get_ollama_client(self.ollama_url)
 
             # Check if model exists, if not pull it
             try:
                 await self.client.show(self.model_name)
                 logger.info(f"Model {self.model_name} already available")
-            except:
+            except Exception:
                 logger.info(f"Pulling model {self.model_name}...")
                 await self.client.pull(self.model_name)
                 logger.info(f"Model {self.model_name} pulled successfully")
 
+            self._mark_ready(True)
+
         except Exception as e:
             logger.error(f"Failed to initialize Ollama model: {e}")
             self.client = None
+            self._mark_ready(False)
+
+    async def close(self):
+        """Stop the background Ollama check before the clients are closed"""
+        task, self._check_task = self._check_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _was_ready(self) -> bool:
+        """Check whether a previous start already verified this model"""
+        try:
+            with open(self.ready_file) as f:
+                return f.read() == self.model_name
+        except OSError:
+            return False
+
+    def _mark_ready(self, ready: bool):
+        """Record (or forget) that Ollama and the model were available"""
+        try:
+            if ready:
+                with open(self.ready_file, "w") as f:
+                    f.write(self.model_name)
+            elif os.path.exists(self.ready_file):
+                os.remove(self.ready_file)
+        except OSError as e:
+            logger.warning(f"Could not update {self.ready_file}: {e}")
 
     def _create_advice_prompt(
         self,
@@ -67,43 +233,66 @@ class AdviceService:
         similarity_score: float,
         shared_keywords: List[str],
         missing_keywords: List[str],
-    ) -> str:
-        """Create structured prompt for LLM advice generation"""
+    ) -> Tuple[str, str]:
+        """Create structured (system, user) prompts for LLM advice generation"""
+
+        prompt = ADVICE_PROMPT.format(
+            similarity_score=similarity_score,
+            missing_keywords=(
+                ", ".join(missing_keywords[:8]) if missing_keywords else "None"
+            ),
+            shared_keywords=(
+                ", ".join(shared_keywords[:8]) if shared_keywords else "None"
+            ),
+        )
 
-        prompt = f"""You are an expert ATS (Applicant Tracking System) resume consultant helping candidates optimize their resumes for specific job postings.
+        return ADVICE_SYSTEM_PROMPT, prompt
 
-**Resume Analysis:**
-- Match Score: {similarity_score:.1%}
-- Missing Keywords: {', '.join(missing_keywords[:8]) if missing_keywords else 'None'}
-- Shared Keywords: {', '.join(shared_keywords[:8]) if shared_keywords else 'None'}
-
-**Your Task:**
-Provide actionable, specific resume advice in JSON format. Focus on concrete improvements that will increase the ATS match score.
+    @alru_cache(maxsize=512)
+    async def _request_advice(self, system: str, prompt: str) -> Dict:
+        """Get validated advice from the LLM, cached per prompt
 
-**Requirements:**
-1. Respond with ONLY valid JSON (no additional text before or after)
-2. Use this exact structure:
+        Raises ValueError for replies that are not a JSON object with the
+        required fields; exceptions are not cached, so the next request for
+        the same prompt asks the LLM again.
+        """
+        response = await self.client.generate(
+            model=self.model_name,
+            system=system,
+            prompt=prompt,
+            keep_alive=self.keep_alive,
+            options={
+                "temperature": 0.7,
+                "num_predict": 1000,  # Increased for more complete responses
+                "top_p": 0.9,
+                "top_k": 40,
+                "repeat_penalty": 1.1,
+            },
+            format="json",  # Request JSON format from Ollama
+        )
+        advice_text = response["response"].strip()
+        logger.info(f"Generated advice length: {len(advice_text)} chars")
+        logger.debug(f"Raw response: {advice_text[:500]}...")
 
-{{
-  "skills_to_add": ["skill1", "skill2", "skill3"],
-  "skills_to_emphasize": ["existing_skill1", "existing_skill2"],
-  "resume_structure": ["tip1", "tip2", "tip3"],
-  "content_optimization": ["tip1", "tip2", "tip3"],
-  "keyword_strategy": "One clear paragraph explaining how to naturally integrate missing keywords",
-  "overall_priority": ["top_priority1", "top_priority2", "top_priority3"]
-}}
+        # Parse JSON response. With format="json" the direct parse succeeds
+        # in the common case; extraction runs at most once otherwise.
+        try:
+            advice_data = orjson.loads(advice_text)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to parse LLM JSON response: {e}")
+            advice_data = _extract_json_object(advice_text)
+            if advice_data is not None:
+                logger.info("Successfully extracted JSON from response")
 
-**Guidelines:**
-- skills_to_add: Select 3-5 most critical missing keywords/skills from the job description
-- skills_to_emphasize: Identify 2-4 existing skills that match the job and should be highlighted more prominently
-- resume_structure: Provide 2-4 specific formatting/organization tips for ATS optimization
-- content_optimization: Give 2-4 specific tips for improving bullet points and descriptions
-- keyword_strategy: Write one clear, actionable paragraph (2-3 sentences) explaining how to naturally incorporate missing keywords
-- overall_priority: List 2-4 most important actions to take immediately, ordered by impact
+        if not isinstance(advice_data, dict):
+            raise ValueError("LLM response is not a JSON object")
 
-Respond with valid JSON only."""
+        # Validate required fields
+        if not _REQUIRED_ADVICE_FIELDS.issubset(advice_data):
+            missing = sorted(_REQUIRED_ADVICE_FIELDS - advice_data.keys())
+            raise ValueError(f"LLM response missing fields: {missing}")
 
-        return prompt
+        return advice_data
 
     async def generate_advice(
         self,
@@ -120,7 +309,7 @@ Respond with valid JSON only."""
             return self._fallback_advice(missing_keywords, shared_keywords)
 
         try:
-            prompt = self._create_advice_prompt(
+            system, prompt = self._create_advice_prompt(
                 resume_text,
                 job_description,
                 similarity_score,
@@ -130,69 +319,35 @@ Respond with valid JSON only."""
 
             logger.info("Generating AI advice with Ollama...")
 
-            response = await self.client.generate(
-                model=self.model_name,
-                prompt=prompt,
-                options={
-                    "temperature": 0.7,
-                    "num_predict": 1000,  # Increased for more complete responses
-                    "top_p": 0.9,
-                    "top_k": 40,
-                    "repeat_penalty": 1.1,
-                },
-                format="json",  # Request JSON format from Ollama
-            )
-
-            advice_text = response["response"].strip()
-            logger.info(f"Generated advice length: {len(advice_text)} chars")
-            logger.debug(f"Raw response: {advice_text[:500]}...")
+            advice_data = await self._request_advice(system, prompt)
+            logger.info("Successfully generated structured advice")
+            return advice_data
 
-            # Parse JSON response
-            try:
-                # Try direct JSON parse first
-                advice_data = json.loads(advice_text)
-
-                # Validate required fields
-                required_fields = [
-                    "skills_to_add",
-                    "skills_to_emphasize",
-                    "resume_structure",
-                    "content_optimization",
-                    "keyword_strategy",
-                    "overall_priority",
-                ]
-
-                if all(field in advice_data for field in required_fields):
-                    logger.info("Successfully generated structured advice")
-                    return advice_data
-                else:
-                    missing = [f for f in required_fields if f not in advice_data]
-                    logger.warning(f"LLM response missing fields: {missing}")
-                    return self._fallback_advice(missing_keywords, shared_keywords)
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM JSON response: {e}")
-
-                # Try to extract JSON from response
-                try:
-                    start = advice_text.find("{")
-                    end = advice_text.rfind("}") + 1
-                    if start >= 0 and end > start:
-                        json_str = advice_text[start:end]
-                        advice_data = json.loads(json_str)
-                        logger.info("Successfully extracted JSON from response")
-                        return advice_data
-                except:
-                    pass
-
-                logger.warning("Falling back to default advice")
-                return self._fallback_advice(missing_keywords, shared_keywords)
+        except ValueError as e:
+            logger.warning(f"{e}; falling back to default advice")
+            return self._fallback_advice(missing_keywords, shared_keywords)
 
         except Exception as e:
             logger.error(f"LLM failed to generate advice: {e}", exc_info=True)
             logger.info("Returning fallback advice")
             return self._fallback_advice(missing_keywords, shared_keywords)
 
+    async def generate_advice_batch(self, requests: List[Dict]) -> List[Optional[Dict]]:
+        """Generate advice for several analyses concurrently
+
+        Each item holds the keyword arguments of ``generate_advice``. At most
+        BATCH_CONCURRENCY generations run at once, since Ollama only serves
+        OLLAMA_NUM_PARALLEL requests in parallel; callers cap the batch size
+        at MAX_BATCH_ADVICE.
+        """
+        slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def generate(request: Dict) -> Optional[Dict]:
+            async with slots:
+                return await self.generate_advice(**request)
+
+        return await asyncio.gather(*(generate(request) for request in requests))
+
     def _fallback_advice(
         self, missing_keywords: List[str], shared_keywords: List[str]
     ) -> Dict:
@@ -212,29 +367,12 @@ Respond with valid JSON only."""
         return {
             "skills_to_add": skills_to_add,
             "skills_to_emphasize": skills_to_emphasize,
-            "resume_structure": [
-                "Use clear section headers: Summary, Experience, Skills, Education",
-                "Use bullet points with strong action verbs (developed, implemented, led)",
-                "Keep formatting simple and ATS-friendly (avoid tables, text boxes, headers/footers)",
-                "Include a dedicated 'Technical Skills' or 'Core Competencies' section",
-            ],
-            "content_optimization": [
-                "Quantify achievements with specific metrics and results (e.g., 'Increased efficiency by 30%')",
-                "Tailor experience descriptions to match job requirements and use similar language",
-                "Use industry-standard terminology and avoid uncommon abbreviations",
-                "Start each bullet point with a strong action verb in past tense",
-            ],
-            "keyword_strategy": "Naturally integrate the missing keywords throughout your resume, especially in your skills section and experience descriptions. Focus on incorporating them in context rather than simply listing them. Use variations of the keywords where appropriate to demonstrate comprehensive understanding.",
-            "overall_priority": [
-                "Add the top 3-5 missing technical skills to your resume if you have them",
-                "Quantify your achievements with specific numbers, percentages, or outcomes",
-                "Tailor your professional summary to highlight experience relevant to this role",
-                "Ensure your skills section prominently features keywords from the job description",
-            ],
+            **_FALLBACK_ADVICE,
         }
 
+    @alru_cache(maxsize=1, ttl=5)
     async def health_check(self) -> bool:
-        """Check if Ollama service is healthy"""
+        """Check if Ollama service is healthy, reusing the result for a few seconds"""
         try:
             if not self.client:
                 return False
@@ -248,33 +386,17 @@ Respond with valid JSON only."""
         if not self.client:
             return {"error": "AI service offline"}
 
-        # The Interview-specific prompt
-        prompt = f"""
-        You are a Senior Technical Recruiter. Evaluate the following spoken interview answer 
-        using the STAR method (Situation, Task, Action, Result).
-
-        **User Answer:** "{transcription}"
-
-        **Requirements:**
-        1. Respond in valid JSON only.
-        2. Identify which STAR components are missing.
-        3. Give a 'STAR Score' out of 10.
-        4. Provide one specific "Pro Tip" for improvement.
-
-        Format:
-        {{
-        "star_score": 8,
-        "missing_components": ["Result"],
-        "feedback": "Your action was clear, but you didn't quantify the outcome.",
-        "pro_tip": "Try saying 'This resulted in a 20% increase in...' next time."
-        }}
-        """
+        prompt = INTERVIEW_FEEDBACK_PROMPT.format(transcription=transcription)
 
         try:
             response = await self.client.generate(
-                model=self.model_name, prompt=prompt, format="json"
+                model=self.model_name,
+                system=INTERVIEW_FEEDBACK_SYSTEM_PROMPT,
+                prompt=prompt,
+                keep_alive=self.keep_alive,
+                format="json",
             )
-            return json.loads(response["response"])
+            return orjson.loads(response["response"])
         except Exception as e:
             logger.error(f"Interview feedback failed: {e}")
             return None
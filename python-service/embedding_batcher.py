@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from anyio import to_thread
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Coalesce encode requests from concurrent callers into shared model batches.
+
+    Texts are queued with a future each; a single consumer drains the queue
+    for up to ``max_wait`` seconds, sorts the batch by length so similar-length
+    texts share padding, and runs one encode call in the AnyIO threadpool.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+    ):
+        self._encode_batch = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Items taken off the queue but not yet answered
+        self._inflight: List[Tuple[str, asyncio.Future]] = []
+
+    def start(self) -> None:
+        """Start the background consumer on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the consumer and fail anything still waiting"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        pending = self._inflight
+        self._inflight = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding batcher stopped"))
+
+    async def encode(self, texts: List[str]) -> List[np.ndarray]:
+        """Queue texts for the next batch and wait for their embeddings"""
+        if self._queue is None:
+            raise RuntimeError("Embedding batcher not started")
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one item, then take whatever else arrives within max_wait"""
+        loop = asyncio.get_running_loop()
+        batch = self._inflight = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+
+            # Skip callers that gave up while queued
+            batch = self._inflight = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            batch.sort(key=lambda item: len(item[0].split()))
+            texts = [text for text, _ in batch]
+
+            try:
+                # Same AnyIO threadpool (and limiter) as keyword extraction
+                vectors = await to_thread.run_sync(self._encode_batch, texts)
+            except Exception as e:
+                logger.error(f"Batch encode of {len(texts)} texts failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+            self._inflight = []
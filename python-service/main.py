@@ -1,18 +1,29 @@
 from fastapi import FastAPI, HTTPException
+from anyio import to_thread
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+import simsimd
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
+import asyncio
+import os
 import re
-from typing import List, Set, Dict, Optional
+import string
+import sys
+import hashlib
+import ahocorasick
+import threading
+from cachetools import LRUCache, TTLCache, cached
+from functools import lru_cache
+from typing import Callable, List, FrozenSet, Dict, Optional
 import logging
 from contextlib import asynccontextmanager
-from advice_service import AdviceService
+from advice_service import AdviceService, MAX_BATCH_ADVICE
+from embedding_batcher import EmbeddingBatcher
+from http_client import get_http_client, close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -21,23 +32,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for keyword extraction
+# Pure numbers with formatting (incl. years), salary abbreviations, date ranges
+_NUM_RE = re.compile(r'^(?:[\d,.$€£¥%]+|\d+[kKmMbB]|\d+[-/]\d+)$')
+_ALPHA_SET = frozenset(string.ascii_letters)
+_TECH_VERSION = re.compile(r'^([a-zA-Z]+)\d+$')
+_ROMAN = re.compile(r'^[IVXLCDM]+$')
+_DIGIT_OR_SYMBOL = re.compile(r'[0-9+#]')
+_STRIP_TABLE = str.maketrans('', '', '.-+#')
+_TECH_SUFFIXES = ('js', 'sql', 'db', 'py', 'rb', 'go', 'rs', 'ts')
+_TECH_SKILL_SUFFIXES = ('js', 'sql', 'db')
+_TECH_INDICATORS = (
+    'java', 'python', 'javascript', 'react', 'aws', 'docker',
+    'kubernetes', 'sql', 'api', 'framework', 'database'
+)
+_CLEAN = re.compile(r'[^\w\s+#.-]')
+_WS = re.compile(r'\s+')
+_TOKEN = re.compile(r'\b[a-zA-Z0-9+#.-]+\b')
+
 # Configuration class for better organization
 class Config:
     CORS_ORIGINS = ["http://localhost:3000", "http://localhost:3001"]
     MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+    # INT8 ONNX export of MODEL_NAME (see onnx_encoder.py); used when present
+    ONNX_MODEL_PATH = os.getenv("ONNX_MODEL_PATH", "minilm_onnx/model_int8.onnx")
+    # Intra-op threads for PyTorch; unset keeps torch's default
+    TORCH_NUM_THREADS = os.getenv("TORCH_NUM_THREADS")
+    # Base URL of an Infinity/TEI embedding server (e.g. http://embeddings:7997);
+    # when set, no model is loaded in-process
+    EMBEDDING_SERVICE_URL = os.getenv("EMBEDDING_SERVICE_URL", "").rstrip("/")
+    # Opt-in: compilation adds startup time and needs torch >= 2.0
+    TORCH_COMPILE = os.getenv("TORCH_COMPILE") == "1"
     MAX_SHARED_KEYWORDS = 15
     MAX_MISSING_KEYWORDS = 12
     MIN_KEYWORD_LENGTH = 3
+    EMBEDDING_CACHE_SIZE = 2048
+    EMBEDDING_CACHE_TTL = 600  # seconds; covers a user's analyze/advice session
+    KEYWORD_CACHE_SIZE = 1024
+    CLASSIFIER_CACHE_SIZE = 16384
+    LEMMA_CACHE_SIZE = 50_000
+    EMBEDDING_MAX_BATCH = 64
+    EMBEDDING_MAX_WAIT = 0.005  # seconds to wait for more texts before encoding
 
 # Global instances (will be initialized in lifespan)
 class AppState:
-    model: Optional[SentenceTransformer] = None
+    model: Optional[SentenceTransformer] = None  # or a compatible OnnxEncoder
     lemmatizer: Optional[WordNetLemmatizer] = None
-    stop_words: Optional[Set[str]] = None
+    lemmatize: Optional[Callable[[str], str]] = None  # memoized lemmatizer.lemmatize
+    stop_words: Optional[FrozenSet[str]] = None
     advice_service: Optional[AdviceService] = None
-    tech_skills: Set[str] = set()
-    business_skills: Set[str] = set()
-    generic_words: Set[str] = set()
+    embedding_batcher: Optional[EmbeddingBatcher] = None
+    tech_skills: FrozenSet[str] = frozenset()
+    business_skills: FrozenSet[str] = frozenset()
+    generic_words: FrozenSet[str] = frozenset()
+    tech_phrase_automaton: Optional[ahocorasick.Automaton] = None
+    # blake2b(text) -> unit-length embedding; only touched from the event loop
+    embedding_cache: TTLCache = TTLCache(
+        maxsize=Config.EMBEDDING_CACHE_SIZE,
+        ttl=Config.EMBEDDING_CACHE_TTL
+    )
 
 state = AppState()
 
@@ -48,9 +101,23 @@ async def lifespan(app: FastAPI):
     logger.info("Starting ATS Similarity Service...")
     
     # Startup
+    # Size the threadpool used for CPU-bound work (model encodes and keyword
+    # extraction) to the machine
+    to_thread.current_default_thread_limiter().total_tokens = os.cpu_count() or 1
+    
     initialize_skill_sets()
     initialize_nltk()
-    load_model()
+    if Config.EMBEDDING_SERVICE_URL:
+        logger.info(f"Using embedding service at {Config.EMBEDDING_SERVICE_URL}")
+    else:
+        load_model()
+        
+        state.embedding_batcher = EmbeddingBatcher(
+            encode_batch,
+            max_batch_size=Config.EMBEDDING_MAX_BATCH,
+            max_wait=Config.EMBEDDING_MAX_WAIT
+        )
+        state.embedding_batcher.start()
     
     state.advice_service = AdviceService()
     await state.advice_service.initialize_model()
@@ -59,8 +126,13 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Shutdown (if needed)
+    # Shutdown
     logger.info("Shutting down service...")
+    if state.embedding_batcher:
+        await state.embedding_batcher.stop()
+    if state.advice_service:
+        await state.advice_service.close()
+    await close_http_client()
 
 app = FastAPI(
     title="ATS Similarity Service",
@@ -111,6 +183,22 @@ def initialize_skill_sets():
         'oauth', 'jwt', 'saml', 'encryption'
     }
     
+    # Multi-word technical phrases, matched with one Aho-Corasick pass
+    tech_phrases = [
+        'machine learning', 'artificial intelligence', 'data science', 
+        'software engineering', 'web development', 'mobile development',
+        'full stack', 'front end', 'back end', 'database design',
+        'system design', 'network security', 'cloud computing',
+        'project management', 'product management', 'quality assurance',
+        'user experience', 'user interface', 'business intelligence',
+        'data analytics', 'software architecture', 'design patterns',
+        'data structures', 'computer science', 'information technology'
+    ]
+    state.tech_phrase_automaton = ahocorasick.Automaton()
+    for phrase in tech_phrases:
+        state.tech_phrase_automaton.add_word(phrase, phrase.replace(' ', '_'))
+    state.tech_phrase_automaton.make_automaton()
+    
     state.business_skills = {
         'leadership', 'stakeholder', 'debugging', 'optimization', 
         'performance', 'scalability', 'security', 'compliance', 'architecture'
@@ -146,50 +234,161 @@ def initialize_skill_sets():
         'deploy', 'operate', 'administer', 'facilitate', 'organize', 'prepare',
         'present', 'train', 'mentor', 'guide', 'assist', 'manage', 'managing'
     }
+    
+    # Tokens are interned as well, so lookups can short-circuit on identity
+    state.tech_skills = intern_words(state.tech_skills)
+    state.business_skills = intern_words(state.business_skills)
+    state.generic_words = intern_words(state.generic_words)
+
+def intern_words(words) -> FrozenSet[str]:
+    """Freeze a word collection with every string interned"""
+    return frozenset(sys.intern(word) for word in words)
 
 def initialize_nltk():
     """Initialize NLTK resources with better error handling"""
     required_packages = [
-        'punkt',
-        'punkt_tab',  # Required for newer NLTK versions
         'stopwords',
         'wordnet',
         'omw-1.4'
     ]
     
     try:
-        for package in required_packages:
-            try:
-                logger.info(f"Downloading {package}...")
-                nltk.download(package, quiet=True)
-            except Exception as e:
-                logger.warning(f"Could not download {package}: {e}")
+        # Images ship the corpora under NLTK_DATA; only local dev downloads
+        if not os.getenv("NLTK_DATA"):
+            for package in required_packages:
+                try:
+                    logger.info(f"Downloading {package}...")
+                    nltk.download(package, quiet=True)
+                except Exception as e:
+                    logger.warning(f"Could not download {package}: {e}")
         
         state.lemmatizer = WordNetLemmatizer()
-        state.stop_words = set(stopwords.words('english'))
+        # WordNet lookups are slow and resume vocabulary repeats heavily
+        state.lemmatize = lru_cache(maxsize=Config.LEMMA_CACHE_SIZE)(state.lemmatizer.lemmatize)
+        # Force WordNet's lazy load now; concurrent first loads from worker threads race
+        state.lemmatizer.lemmatize('skills')
+        state.stop_words = intern_words(stopwords.words('english'))
         logger.info("NLTK initialized successfully")
         
     except Exception as e:
         logger.error(f"Failed to initialize NLTK: {e}")
         # Fallback to basic stop words and no lemmatizer
         state.lemmatizer = None
-        state.stop_words = {
+        state.lemmatize = None
+        state.stop_words = intern_words({
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 
             'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 
             'are', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
             'this', 'that', 'these', 'those', 'it', 'its', 'they', 'their',
             'will', 'would', 'should', 'could', 'can', 'may', 'might', 'must'
-        }
+        })
 
 def load_model():
-    """Load the sentence transformer model with error handling"""
+    """Load the sentence transformer model with error handling
+    
+    Prefers the quantized ONNX Runtime export when it exists and falls back
+    to the PyTorch model otherwise.
+    """
     try:
-        state.model = SentenceTransformer(Config.MODEL_NAME)
-        logger.info(f"Model '{Config.MODEL_NAME}' loaded successfully")
+        state.model = None
+        if os.path.exists(Config.ONNX_MODEL_PATH):
+            try:
+                from onnx_encoder import OnnxEncoder
+                state.model = OnnxEncoder(Config.ONNX_MODEL_PATH)
+                logger.info(f"ONNX model '{Config.ONNX_MODEL_PATH}' loaded successfully")
+            except Exception as e:
+                logger.warning(f"Could not load ONNX model, using PyTorch: {e}")
+        
+        if state.model is None:
+            if Config.TORCH_NUM_THREADS:
+                import torch
+                torch.set_num_threads(int(Config.TORCH_NUM_THREADS))
+            state.model = SentenceTransformer(Config.MODEL_NAME)
+            logger.info(f"Model '{Config.MODEL_NAME}' loaded successfully")
+            if Config.TORCH_COMPILE:
+                compile_model()
+        
+        # Let simsimd pick its SIMD kernel before the first request
+        probe = np.ones(state.model.get_sentence_embedding_dimension(), dtype=np.float32)
+        simsimd.cosine(probe, probe)
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
         raise RuntimeError(f"Could not load model: {e}")
 
+def compile_model():
+    """Compile the transformer forward pass, keeping eager mode on failure"""
+    transformer = state.model[0]
+    eager = transformer.auto_model
+    try:
+        import torch
+        transformer.auto_model = torch.compile(eager, dynamic=True)
+        # Trigger compilation now rather than on the first request
+        state.model.encode(["warm up"], normalize_embeddings=True)
+        logger.info("Model forward pass compiled with torch.compile")
+    except Exception as e:
+        transformer.auto_model = eager
+        logger.warning(f"torch.compile unavailable, using eager mode: {e}")
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so trivially different texts share cache entries
+    
+    Neither changes the result: the MiniLM tokenizer is uncased and keyword
+    extraction lowercases and collapses whitespace itself.
+    """
+    return _WS.sub(' ', text).strip().lower()
+
+def encode_batch(texts: List[str]) -> np.ndarray:
+    """Run one model pass over a length-sorted batch from the batcher"""
+    return state.model.encode(
+        texts,
+        batch_size=len(texts),
+        normalize_embeddings=True,
+        convert_to_numpy=True
+    )
+
+def text_digest(text: str) -> bytes:
+    """Cache key for a text that does not keep the text itself alive"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+async def encode_remote(texts: List[str]) -> List[np.ndarray]:
+    """Embed texts via the OpenAI-compatible /embeddings route of Infinity or TEI"""
+    response = await get_http_client().post(
+        f"{Config.EMBEDDING_SERVICE_URL}/embeddings",
+        json={"input": texts, "model": Config.MODEL_NAME}
+    )
+    response.raise_for_status()
+    
+    data = sorted(response.json()["data"], key=lambda item: item["index"])
+    vectors = np.asarray([item["embedding"] for item in data], dtype=np.float32)
+    # Servers differ on whether they normalize; the cosine path expects unit length
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    return list(vectors)
+
+async def encode_texts(texts: List[str]) -> List[np.ndarray]:
+    """Encode normalized texts to unit-length embeddings, reusing cached ones
+    
+    Cache misses go to the embedding service when one is configured, and
+    otherwise to the shared batcher so concurrent requests are encoded
+    together.
+    """
+    cache = state.embedding_cache
+    keys = [text_digest(text) for text in texts]
+    
+    embeddings = [cache.get(key) for key in keys]
+    
+    misses = [i for i, vector in enumerate(embeddings) if vector is None]
+    if misses:
+        pending = [texts[i] for i in misses]
+        if Config.EMBEDDING_SERVICE_URL:
+            vectors = await encode_remote(pending)
+        else:
+            vectors = await state.embedding_batcher.encode(pending)
+        for i, vector in zip(misses, vectors):
+            cache[keys[i]] = vector
+            embeddings[i] = vector
+    
+    return embeddings
+
 # Request/Response Models with better validation
 class SimilarityRequest(BaseModel):
     resume_text: str = Field(..., min_length=10, description="Resume text content")
@@ -218,34 +417,25 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "model_loaded": state.model is not None,
+        "model_loaded": state.model is not None or bool(Config.EMBEDDING_SERVICE_URL),
+        "embedding_backend": "remote" if Config.EMBEDDING_SERVICE_URL else "local",
         "nltk_initialized": state.lemmatizer is not None,
         "llm_available": llm_healthy,
         "version": "1.0.0"
     }
 
-def is_pure_number(word: str) -> bool:
-    """Check if a word is a pure number or number-like pattern"""
-    patterns = [
-        r'^[\d,\.\$€£¥%]+$',  # Pure numbers with formatting
-        r'^\d+[kKmMbB]$',      # Salary abbreviations
-        r'^\d+[-/]\d+$',       # Date ranges
-        r'^\d{4}$',            # Years
-        r'^\d+$'               # Any pure number
-    ]
-    return word.isdigit() or any(re.match(pattern, word) for pattern in patterns)
-
+@lru_cache(maxsize=Config.CLASSIFIER_CACHE_SIZE)
 def has_technical_pattern(word: str) -> bool:
     """Check if word has clear technical indicators"""
-    if len(word) < 3 or not re.search(r'[a-zA-Z]', word):
+    if len(word) < 3 or _ALPHA_SET.isdisjoint(word):
         return False
     
     # Special characters that indicate tech terms
-    if re.match(r'.*[+#].*', word):
+    if '+' in word or '#' in word:
         return True
     
     # Framework patterns
-    if word.endswith(('js', 'sql', 'db', 'py', 'rb', 'go', 'rs', 'ts')):
+    if word.endswith(_TECH_SUFFIXES):
         return True
     
     # API related
@@ -253,157 +443,144 @@ def has_technical_pattern(word: str) -> bool:
         return True
     
     # Version numbers with known tech (python3, vue2)
-    if re.match(r'^[a-zA-Z]+\d+$', word):
-        letter_part = re.match(r'^([a-zA-Z]+)\d+$', word).group(1)
-        if letter_part in state.tech_skills:
-            return True
+    version = _TECH_VERSION.match(word)
+    if version and version.group(1) in state.tech_skills:
+        return True
     
     # Acronyms (not roman numerals)
-    if len(word) >= 3 and word.isupper() and not re.match(r'^[IVXLCDM]+$', word):
-        return True
+    return word.isupper() and not _ROMAN.match(word)
+
+@cached(
+    LRUCache(maxsize=Config.KEYWORD_CACHE_SIZE),
+    key=text_digest,
+    lock=threading.Lock()
+)
+def _extract_keywords(text: str) -> FrozenSet[str]:
+    """Keyword extraction proper, cached by text digest
+    
+    Exceptions propagate and are not cached, so a failure is retried on the
+    next request for the same text. Results are frozensets since they are
+    shared between callers.
+    """
+    # Clean and normalize text
+    text = _CLEAN.sub(' ', text.lower())
+    text = _WS.sub(' ', text).strip()
+    
+    # Extract multi-word technical terms in a single pass
+    multi_word_terms = {term for _, term in state.tech_phrase_automaton.iter(text)}
+    
+    # Tokenize with the compiled regex, lemmatizing through the cache.
+    # Unique tokens only, with the set lookups ahead of the scans and
+    # regex since most tokens are common words
+    lemmatize = state.lemmatize
+    stop_words, generic_words = state.stop_words, state.generic_words
+    single_words = set()
+    candidates = (
+        token for token in set(_TOKEN.findall(text))
+        if len(token) > Config.MIN_KEYWORD_LENGTH
+        and token not in stop_words
+        and token not in generic_words
+        and not _ALPHA_SET.isdisjoint(token)  # has a letter, so not isdigit()
+        and not _NUM_RE.match(token)
+    )
+    for token in candidates:
+        word = sys.intern(lemmatize(token) if lemmatize else token)
+        if word not in stop_words:
+            single_words.add(word)
+    
+    # Classify each word once: curated skills (also with punctuation
+    # stripped, e.g. node.js -> nodejs) or a clear technical pattern
+    relevant_keywords = set()
+    for word in single_words:
+        if word in generic_words or word in stop_words:
+            continue
+        word_clean = word.translate(_STRIP_TABLE)
+        if (word in state.tech_skills or word_clean in state.tech_skills or
+            word in state.business_skills or word_clean in state.business_skills or
+            has_technical_pattern(word)):
+            relevant_keywords.add(word)
     
-    return False
+    # Add multi-word terms
+    relevant_keywords.update(multi_word_terms)
+    
+    return frozenset(relevant_keywords)
 
-def extract_skills_and_keywords(text: str) -> Set[str]:
+def extract_skills_and_keywords(text: str) -> FrozenSet[str]:
     """Extract skills, technologies, and relevant professional keywords from text"""
     
     if not text or not text.strip():
-        return set()
+        return frozenset()
     
     try:
-        # Clean and normalize text
-        text = re.sub(r'[^\w\s+#.-]', ' ', text.lower())
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Extract multi-word technical terms
-        multi_word_terms = set()
-        tech_phrases = [
-            'machine learning', 'artificial intelligence', 'data science', 
-            'software engineering', 'web development', 'mobile development',
-            'full stack', 'front end', 'back end', 'database design',
-            'system design', 'network security', 'cloud computing',
-            'project management', 'product management', 'quality assurance',
-            'user experience', 'user interface', 'business intelligence',
-            'data analytics', 'software architecture', 'design patterns',
-            'data structures', 'computer science', 'information technology'
-        ]
-        
-        for phrase in tech_phrases:
-            if phrase in text:
-                multi_word_terms.add(phrase.replace(' ', '_'))
-        
-        # Tokenize
-        if state.lemmatizer:
-            try:
-                tokens = word_tokenize(text)
-                single_words = set()
-                for token in tokens:
-                    if (len(token) > Config.MIN_KEYWORD_LENGTH and 
-                        re.search(r'[a-zA-Z]', token) and 
-                        not is_pure_number(token)):
-                        lemmatized = state.lemmatizer.lemmatize(token.lower())
-                        if lemmatized not in state.stop_words:
-                            single_words.add(lemmatized)
-            except Exception as e:
-                logger.warning(f"Tokenization failed, falling back to regex: {e}")
-                # Fallback to regex tokenization
-                words = re.findall(r'\b[a-zA-Z0-9+#.-]+\b', text.lower())
-                single_words = {
-                    word for word in words 
-                    if len(word) > Config.MIN_KEYWORD_LENGTH 
-                    and re.search(r'[a-zA-Z]', word) 
-                    and not is_pure_number(word)
-                    and word not in state.stop_words
-                }
-        else:
-            words = re.findall(r'\b[a-zA-Z0-9+#.-]+\b', text.lower())
-            single_words = {
-                word for word in words 
-                if len(word) > Config.MIN_KEYWORD_LENGTH 
-                and re.search(r'[a-zA-Z]', word) 
-                and not is_pure_number(word)
-                and word not in state.stop_words
-            }
-        
-        # Collect relevant keywords
-        relevant_keywords = set()
-        
-        # Add words from curated skill sets
-        for word in single_words:
-            word_clean = word.replace('.', '').replace('-', '').replace('+', '').replace('#', '')
-            
-            if (word in state.tech_skills or word_clean in state.tech_skills or
-                word in state.business_skills or word_clean in state.business_skills):
-                relevant_keywords.add(word)
-        
-        # Add words with clear technical patterns
-        for word in single_words:
-            if (word not in relevant_keywords and 
-                word not in state.generic_words and 
-                word not in state.stop_words and
-                has_technical_pattern(word)):
-                relevant_keywords.add(word)
-        
-        # Final filtering
-        relevant_keywords = relevant_keywords - state.generic_words - state.stop_words
-        
-        # Add multi-word terms
-        relevant_keywords.update(multi_word_terms)
-        
-        return relevant_keywords
-        
+        return _extract_keywords(text)
     except Exception as e:
         logger.error(f"Error extracting keywords: {e}", exc_info=True)
-        return set()
+        return frozenset()
 
+@lru_cache(maxsize=Config.CLASSIFIER_CACHE_SIZE)
 def is_technical_skill(keyword: str) -> bool:
     """Determine if a keyword is a technical skill for sorting"""
-    tech_indicators = [
-        'java', 'python', 'javascript', 'react', 'aws', 'docker',
-        'kubernetes', 'sql', 'api', 'framework', 'database'
-    ]
+    if keyword.endswith(_TECH_SKILL_SUFFIXES):
+        return True
+    if len(keyword) >= 3 and keyword.isupper():
+        return True
+    if _DIGIT_OR_SYMBOL.search(keyword):
+        return True
+    lowered = keyword.lower()
+    return any(tech in lowered for tech in _TECH_INDICATORS)
+
+def rank_keywords(resume_keywords: FrozenSet[str], job_keywords: FrozenSet[str]):
+    """Return the shared and missing job keywords, technical skills first"""
+    # Find shared and missing keywords
+    shared = list(resume_keywords.intersection(job_keywords))
+    missing = list(job_keywords - resume_keywords)
     
-    return (any(tech in keyword.lower() for tech in tech_indicators) or
-            re.match(r'.*[0-9+#].*', keyword) or
-            keyword.endswith(('js', 'sql', 'db')) or
-            (len(keyword) >= 3 and keyword.isupper()))
+    # Sort by technical relevance, classifying each keyword once.
+    # Keywords come from lowercased text, so no case folding is needed
+    tech_flags = {kw: is_technical_skill(kw) for kw in shared}
+    tech_flags.update((kw, is_technical_skill(kw)) for kw in missing)
+    shared.sort(key=lambda x: (not tech_flags[x], x))
+    missing.sort(key=lambda x: (not tech_flags[x], x))
+    
+    return shared, missing
 
 @app.post("/similarity", response_model=SimilarityResponse)
 async def calculate_similarity(request: SimilarityRequest):
     """Calculate similarity between resume and job description"""
     
-    if not state.model:
+    if not state.model and not Config.EMBEDDING_SERVICE_URL:
         raise HTTPException(status_code=503, detail="Model not loaded")
     
     try:
-        resume_text = request.resume_text.strip()
-        job_text = request.job_description.strip()
-        
-        logger.info(f"Processing similarity - Resume: {len(resume_text)} chars, Job: {len(job_text)} chars")
-        
-        # Generate embeddings
-        embeddings = state.model.encode([resume_text, job_text])
-        
-        # Calculate cosine similarity
-        similarity_score = float(cosine_similarity([embeddings[0]], [embeddings[1]])[0][0])
-        
-        # Extract keywords
-        resume_keywords = extract_skills_and_keywords(resume_text)
-        job_keywords = extract_skills_and_keywords(job_text)
+        resume_text = normalize_text(request.resume_text)
+        job_text = normalize_text(request.job_description)
+        
+        logger.debug("Processing similarity - Resume: %d chars, Job: %d chars", len(resume_text), len(job_text))
+        
+        # Encode (via the batcher) and extract both keyword sets concurrently;
+        # extraction is pure Python, so it runs in the threadpool. All three
+        # are cached per text
+        embeddings, resume_keywords, job_keywords = await asyncio.gather(
+            encode_texts([resume_text, job_text]),
+            to_thread.run_sync(extract_skills_and_keywords, resume_text),
+            to_thread.run_sync(extract_skills_and_keywords, job_text)
+        )
         
-        # Find shared and missing keywords
-        shared = list(resume_keywords.intersection(job_keywords))
-        missing = list(job_keywords - resume_keywords)
+        # SIMD cosine kernel; simsimd returns the cosine distance. Clamp to the
+        # response range since rounding can push identical texts just past 1.0
+        similarity_score = 1.0 - float(simsimd.cosine(embeddings[0], embeddings[1]))
+        similarity_score = min(max(similarity_score, 0.0), 1.0)
         
-        # Sort by technical relevance
-        shared.sort(key=lambda x: (not is_technical_skill(x), x.lower()))
-        missing.sort(key=lambda x: (not is_technical_skill(x), x.lower()))
+        shared, missing = rank_keywords(resume_keywords, job_keywords)
         
         # Limit results
         shared_keywords = shared[:Config.MAX_SHARED_KEYWORDS]
         missing_keywords = missing[:Config.MAX_MISSING_KEYWORDS]
         
-        logger.info(f"Similarity: {similarity_score:.4f}, Shared: {len(shared_keywords)}, Missing: {len(missing_keywords)}")
+        logger.info(
+            "Similarity: %.4f, Shared: %d, Missing: %d",
+            similarity_score, len(shared_keywords), len(missing_keywords)
+        )
         
         return SimilarityResponse(
             similarity_score=similarity_score,
@@ -433,16 +610,18 @@ async def get_resume_advice(request: AdviceRequest):
     try:
         logger.info("Generating resume advice...")
         
-        advice_data = await state.advice_service.generate_advice(
-            resume_text=request.resume_text,
-            job_description=request.job_description,
-            similarity_score=request.similarity_score,
-            shared_keywords=request.shared_keywords,
-            missing_keywords=request.missing_keywords
+        # The (briefly cached) health probe overlaps with generation
+        advice_data, llm_available = await asyncio.gather(
+            state.advice_service.generate_advice(
+                resume_text=request.resume_text,
+                job_description=request.job_description,
+                similarity_score=request.similarity_score,
+                shared_keywords=request.shared_keywords,
+                missing_keywords=request.missing_keywords
+            ),
+            state.advice_service.health_check()
         )
         
-        llm_available = await state.advice_service.health_check()
-        
         return AdviceResponse(advice=advice_data, llm_available=llm_available)
         
     except Exception as e:
@@ -454,6 +633,41 @@ async def get_resume_advice(request: AdviceRequest):
         
         return AdviceResponse(advice=fallback_advice, llm_available=False)
 
+@app.post("/advice/batch", response_model=List[AdviceResponse])
+async def get_resume_advice_batch(requests: List[AdviceRequest]):
+    """Generate advice for several analyses concurrently"""
+    
+    if len(requests) > MAX_BATCH_ADVICE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BATCH_ADVICE} analyses per batch"
+        )
+    
+    if not state.advice_service:
+        logger.warning("Advice service not initialized")
+        return [AdviceResponse(advice=None, llm_available=False) for _ in requests]
+    
+    logger.info(f"Generating resume advice for {len(requests)} requests...")
+    
+    advice_list, llm_available = await asyncio.gather(
+        state.advice_service.generate_advice_batch([
+            {
+                "resume_text": request.resume_text,
+                "job_description": request.job_description,
+                "similarity_score": request.similarity_score,
+                "shared_keywords": request.shared_keywords,
+                "missing_keywords": request.missing_keywords
+            }
+            for request in requests
+        ]),
+        state.advice_service.health_check()
+    )
+    
+    return [
+        AdviceResponse(advice=advice_data, llm_available=llm_available)
+        for advice_data in advice_list
+    ]
+
 @app.get("/")
 async def root():
     """Root endpoint with service info"""
@@ -465,15 +679,19 @@ async def root():
             "GET /": "Service information",
             "GET /health": "Health check",
             "POST /similarity": "Calculate resume-job similarity",
-            "POST /advice": "Get AI-powered resume advice"
+            "POST /advice": "Get AI-powered resume advice",
+            "POST /advice/batch": "Get advice for several analyses concurrently"
         }
     }
 
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        app, 
+        "main:app", 
         host="0.0.0.0", 
         port=8000,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2"))
     )
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""INT8 ONNX Runtime encoder for all-MiniLM-L6-v2.
+
+Build the model once with:
+
+    pip install optimum[onnxruntime]
+    python onnx_encoder.py minilm_onnx
+
+and point ONNX_MODEL_PATH at ``minilm_onnx/model_int8.onnx``. The tokenizer
+is saved next to the model.
+"""
+import os
+import sys
+import logging
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_SEQ_LENGTH = 256  # matches the SentenceTransformer config for MiniLM
+
+
+class OnnxEncoder:
+    """Drop-in for the parts of SentenceTransformer the service uses"""
+
+    def __init__(self, model_path: str, num_threads: int = 0):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or max(1, (os.cpu_count() or 2) // 2)
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(os.path.dirname(model_path))
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.dimension = self.session.get_outputs()[0].shape[-1]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        convert_to_numpy: bool = True,
+    ) -> np.ndarray:
+        """Mean-pool token embeddings per text, optionally L2-normalized"""
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQ_LENGTH,
+                return_tensors="np",
+            )
+            feeds = {k: v.astype(np.int64) for k, v in tokens.items() if k in self.input_names}
+            hidden = self.session.run(None, feeds)[0]
+            batches.append(mean_pool(hidden, tokens["attention_mask"]))
+
+        embeddings = np.concatenate(batches) if batches else np.empty((0, self.dimension), np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.maximum(norms, 1e-12)
+        return embeddings.astype(np.float32)
+
+
+def mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Average token vectors, ignoring padding"""
+    mask = attention_mask[..., None].astype(hidden.dtype)
+    return (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+
+def export(output_dir: str, model_name: str = "sentence-transformers/all-MiniLM-L6-v2") -> str:
+    """Export the model to ONNX and dynamically quantize its weights to INT8"""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoTokenizer
+
+    model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+    model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+
+    quantized = os.path.join(output_dir, "model_int8.onnx")
+    quantize_dynamic(
+        os.path.join(output_dir, "model.onnx"),
+        quantized,
+        weight_type=QuantType.QInt8,
+    )
+    return quantized
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    path = export(sys.argv[1] if len(sys.argv) > 1 else "minilm_onnx")
+    logger.info(f"Wrote {path}")
@@ -0,0 +1,105 @@
+import asyncio
+
+import orjson
+
+from advice_service import AdviceService, BATCH_CONCURRENCY, _REQUIRED_ADVICE_FIELDS
+
+VALID_ADVICE = {field: f"{field} advice" for field in _REQUIRED_ADVICE_FIELDS}
+
+
+class FakeClient:
+    """Returns the queued replies in order and counts generate calls"""
+
+    def __init__(self, *replies: str):
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def generate(self, **kwargs):
+        self.calls += 1
+        return {"response": self.replies.pop(0)}
+
+
+def advise_twice(service: AdviceService, missing_keywords):
+    """Request the same advice twice on one event loop"""
+
+    async def run():
+        results = []
+        for _ in range(2):
+            results.append(
+                await service.generate_advice(
+                    resume_text="resume",
+                    job_description="job",
+                    similarity_score=0.5,
+                    shared_keywords=["python"],
+                    missing_keywords=missing_keywords,
+                )
+            )
+        return results
+
+    return asyncio.run(run())
+
+
+def test_invalid_reply_is_not_cached():
+    service = AdviceService()
+    service.client = FakeClient('{"skills_to_add": [', orjson.dumps(VALID_ADVICE).decode())
+
+    first, second = advise_twice(service, ["invalid-then-valid"])
+
+    assert first != VALID_ADVICE  # fallback advice
+    assert second == VALID_ADVICE
+    assert service.client.calls == 2
+
+
+def test_incomplete_reply_is_not_cached():
+    partial = {"skills_to_add": ["docker"]}
+    service = AdviceService()
+    service.client = FakeClient(orjson.dumps(partial).decode(), orjson.dumps(VALID_ADVICE).decode())
+
+    first, second = advise_twice(service, ["partial-then-valid"])
+
+    assert first != partial
+    assert second == VALID_ADVICE
+    assert service.client.calls == 2
+
+
+def test_valid_reply_is_cached():
+    service = AdviceService()
+    service.client = FakeClient(orjson.dumps(VALID_ADVICE).decode())
+
+    assert advise_twice(service, ["cached"]) == [VALID_ADVICE, VALID_ADVICE]
+    assert service.client.calls == 1
+
+
+class SlowClient:
+    """Tracks how many generate calls are in flight at once"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {"response": orjson.dumps(VALID_ADVICE).decode()}
+
+
+def test_batch_concurrency_is_bounded():
+    service = AdviceService()
+    service.client = SlowClient()
+    requests = [
+        {
+            "resume_text": "resume",
+            "job_description": "job",
+            "similarity_score": 0.5,
+            "shared_keywords": ["python"],
+            "missing_keywords": [f"bounded-{i}"],
+        }
+        for i in range(BATCH_CONCURRENCY * 3)
+    ]
+
+    results = asyncio.run(service.generate_advice_batch(requests))
+
+    assert results == [VALID_ADVICE] * len(requests)
+    assert service.client.peak == BATCH_CONCURRENCY
@@ -0,0 +1,150 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from embedding_batcher import EmbeddingBatcher
+from onnx_encoder import mean_pool
+
+
+class RecordingEncoder:
+    """Fake model: one vector per text, tagged with the text's word count"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [np.array([len(text.split())], dtype=np.float32) for text in texts]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_callers_share_one_batch():
+    encoder = RecordingEncoder()
+
+    async def scenario():
+        batcher = EmbeddingBatcher(encoder, max_wait=0.05)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                batcher.encode(["one"]),
+                batcher.encode(["two words", "three words here"]),
+                batcher.encode(["four words in here"]),
+            )
+        finally:
+            await batcher.stop()
+
+    results = run(scenario())
+
+    assert len(encoder.calls) == 1
+    assert sorted(encoder.calls[0]) == sorted(
+        ["one", "two words", "three words here", "four words in here"]
+    )
+    assert [[v[0] for v in r] for r in results] == [[1], [2, 3], [4]]
+
+
+def test_results_follow_callers_after_length_sort():
+    encoder = RecordingEncoder()
+    texts = ["a b c d e", "a", "a b c", "a b"]
+
+    async def scenario():
+        batcher = EmbeddingBatcher(encoder, max_wait=0.05)
+        batcher.start()
+        try:
+            return await batcher.encode(texts)
+        finally:
+            await batcher.stop()
+
+    vectors = run(scenario())
+
+    assert encoder.calls == [["a", "a b", "a b c", "a b c d e"]]
+    assert [v[0] for v in vectors] == [5, 1, 3, 2]
+
+
+def test_cancelled_caller_is_skipped():
+    encoder = RecordingEncoder()
+
+    async def scenario():
+        batcher = EmbeddingBatcher(encoder, max_wait=0.05)
+        batcher.start()
+        try:
+            gave_up = asyncio.create_task(batcher.encode(["abandoned text"]))
+            await asyncio.sleep(0)  # let it queue
+            gave_up.cancel()
+            return await batcher.encode(["kept"])
+        finally:
+            await batcher.stop()
+
+    vectors = run(scenario())
+
+    assert encoder.calls == [["kept"]]
+    assert vectors[0][0] == 1
+
+
+def test_stop_fails_collected_futures():
+    encoder = RecordingEncoder()
+
+    async def scenario():
+        # A long max_wait keeps the first text in the half-built batch
+        batcher = EmbeddingBatcher(encoder, max_wait=10)
+        batcher.start()
+        collected = asyncio.create_task(batcher.encode(["being collected"]))
+        await asyncio.sleep(0.01)
+
+        await batcher.stop()
+        return await asyncio.gather(collected, return_exceptions=True)
+
+    (collected,) = run(scenario())
+
+    assert isinstance(collected, RuntimeError)
+    assert encoder.calls == []
+
+
+def test_stop_fails_queued_futures():
+    encoder = RecordingEncoder()
+
+    async def scenario():
+        batcher = EmbeddingBatcher(encoder, max_wait=10)
+        batcher.start()
+        queued = [asyncio.create_task(batcher.encode([f"text {i}"])) for i in range(3)]
+        await asyncio.sleep(0)  # queue the texts before the consumer resumes
+
+        await batcher.stop()
+        return await asyncio.gather(*queued, return_exceptions=True)
+
+    results = run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert encoder.calls == []
+
+
+def test_encode_before_start_raises():
+    batcher = EmbeddingBatcher(RecordingEncoder())
+
+    with pytest.raises(RuntimeError):
+        run(batcher.encode(["text"]))
+
+
+def test_mean_pool_ignores_padding():
+    hidden = np.array(
+        [
+            [[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]],
+            [[5.0, 5.0], [100.0, 100.0], [100.0, 100.0]],
+        ],
+        dtype=np.float32,
+    )
+    mask = np.array([[1, 1, 0], [1, 0, 0]])
+
+    pooled = mean_pool(hidden, mask)
+
+    np.testing.assert_allclose(pooled, [[2.0, 3.0], [5.0, 5.0]])
+
+
+def test_mean_pool_handles_fully_masked_rows():
+    hidden = np.ones((1, 2, 3), dtype=np.float32)
+    mask = np.zeros((1, 2), dtype=np.int64)
+
+    np.testing.assert_allclose(mean_pool(hidden, mask), np.zeros((1, 3)))
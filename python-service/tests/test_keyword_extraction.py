@@ -0,0 +1,42 @@
+import main
+from main import extract_skills_and_keywords, state
+
+
+class FlakyAutomaton:
+    """Fails on the first scan, then delegates to the real automaton"""
+
+    def __init__(self, automaton):
+        self.automaton = automaton
+        self.calls = 0
+
+    def iter(self, text):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("transient failure")
+        return self.automaton.iter(text)
+
+
+def setup_module():
+    main.initialize_skill_sets()
+    state.stop_words = main.intern_words({"the", "with", "and"})
+    state.lemmatize = None
+
+
+def test_keywords_are_cached_by_digest():
+    text = "senior python engineer with docker and machine learning"
+    keywords = extract_skills_and_keywords(text)
+
+    assert {"python", "docker", "machine_learning"} <= keywords
+    assert main.text_digest(text) in main._extract_keywords.cache
+    assert text not in main._extract_keywords.cache
+
+
+def test_failure_is_not_cached():
+    text = "kubernetes operator written in golang"
+    real = state.tech_phrase_automaton
+    state.tech_phrase_automaton = FlakyAutomaton(real)
+    try:
+        assert extract_skills_and_keywords(text) == frozenset()
+        assert "kubernetes" in extract_skills_and_keywords(text)
+    finally:
+        state.tech_phrase_automaton = real